@@ -0,0 +1,499 @@
+# pasos_core.py  (datos, iconos y gráfico compartidos por pasos2.py y pasos3.py)
+import os, io, requests, hashlib, time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from requests.adapters import HTTPAdapter
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# matplotlib y PIL se importan dentro de las funciones que los usan: en frío
+# el título y la tabla se pintan antes de pagar su carga
+
+ICON_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pasos")
+ICON_CACHE_BYTES = 50 * 1024 * 1024   # tope del disco; se expulsan los menos usados
+ICON_MAX_AGE = 24 * 3600              # pasado esto se revalida con If-None-Match
+FETCH_WORKERS = 16                    # hilos de descarga = conexiones por host en el pool
+
+# Lo que cambia entre páginas al dibujar (hashable: entra en las claves de caché).
+# Por defecto el gráfico de pasos3; pasos2 centra las pilas, no escalona nombres
+# y pone un tick cada décimo del eje
+ChartStyle = namedtuple(
+    "ChartStyle", "center_stacks stagger_labels step_ticks ylim title_size",
+    defaults=(False, True, False, (-0.6, 2.0), 14),
+)
+
+# ----------------------- Data -----------------------
+
+def read_sheet(data: bytes, value_col: str) -> pd.DataFrame:
+    # Solo las 3 primeras columnas, ya nombradas (Nombre, <value_col>, Icon) y
+    # tipadas; "1,234" lo convierte el parser de C si toda la columna es numérica
+    columns = ["Nombre", value_col, "Icon"]
+    opts = dict(header=0, thousands=",", dtype={"Nombre": str, "Icon": str}, engine="c")
+    try:
+        return pd.read_csv(io.BytesIO(data), usecols=[0, 1, 2], names=columns, **opts)
+    except pd.errors.ParserError:
+        # Hoja sin columna de iconos
+        return pd.read_csv(io.BytesIO(data), usecols=[0, 1], names=columns[:2], **opts)
+
+@st.cache_resource(show_spinner=False)
+def sheet_store() -> dict:
+    # (url, value_col) -> (validadores del último 200, DataFrame ya limpio)
+    return {}
+
+@st.cache_data(ttl=60)
+def load_data(url: str, value_col: str, clean_names: bool = True) -> pd.DataFrame:
+    # Descarga por la sesión compartida (gzip + keep-alive) en vez del urllib de pandas.
+    # Al caducar el ttl se pregunta con ETag / Last-Modified: un 304 reutiliza
+    # el DataFrame anterior sin bajar ni parsear la hoja
+    store = sheet_store()
+    validators, last = store.get((url, value_col, clean_names), ({}, None))
+    # Conectar falla rápido; la exportación de Sheets puede tardar en responder
+    r = http_session().get(url, timeout=(3.05, 15), headers=validators)
+    if r.status_code == 304 and last is not None:
+        return last.copy()
+    r.raise_for_status()
+    df = read_sheet(r.content, value_col).dropna(how="all")
+
+    # Primero descarta nombres nulos, luego (si se pide) limpia strings
+    df = df.dropna(subset=["Nombre"])
+    if clean_names:
+        df["Nombre"] = df["Nombre"].astype(str).str.strip()
+        df = df[df["Nombre"] != ""]
+
+    # Valor → int (si alguna celda no es numérica llega como texto con comas)
+    s = df[value_col]
+    if not pd.api.types.is_numeric_dtype(s):
+        s = s.str.replace(",", "", regex=False)
+    df[value_col] = pd.to_numeric(s, errors="coerce")
+    df = df.dropna(subset=[value_col]).astype({value_col: int})
+
+    # Tipos compactos: menos que serializar en la caché y hacia st.dataframe
+    # (sin NaN ya es entero: un solo downcast al menor tipo que quepa)
+    df[value_col] = pd.to_numeric(df[value_col], downcast="unsigned")
+    df["Nombre"] = df["Nombre"].astype("category")
+
+    validators = {}
+    if "ETag" in r.headers:
+        validators["If-None-Match"] = r.headers["ETag"]
+    if "Last-Modified" in r.headers:
+        validators["If-Modified-Since"] = r.headers["Last-Modified"]
+    store[(url, value_col, clean_names)] = (validators, df.copy())   # copia: el proceso la comparte
+    return df
+
+URL_PREFIXES = ("http://", "https://")
+IMG_EXT = (".png", ".jpg", ".jpeg", ".webp")
+
+def is_url(s: str) -> bool:
+    return isinstance(s, str) and s.lower().startswith(URL_PREFIXES)
+
+def image_mask(icons: pd.Series) -> np.ndarray:
+    # ¿URL o ruta de imagen? Sobre toda la columna, con un solo .str.lower()
+    low = icons.str.lower()
+    return (low.str.startswith(URL_PREFIXES) | low.str.endswith(IMG_EXT)).to_numpy()
+
+def to_raw_if_github(url: str) -> str:
+    # https://github.com/u/r/blob/sha/path -> https://raw.githubusercontent.com/u/r/sha/path
+    if isinstance(url, str) and "github.com" in url and "/blob/" in url:
+        return url.replace("https://github.com/", "https://raw.githubusercontent.com/").replace("/blob/", "/")
+    return url
+
+@st.cache_resource(show_spinner=False)
+def http_session() -> requests.Session:
+    # Una sola sesión por proceso: keep-alive y pool compartidos entre hilos y reruns
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0"
+    # Tantas conexiones por host como hilos: ninguna se abre y se tira
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=FETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def icon_cache_path(icon_str: str, px: int) -> str:
+    # El array RGBA ya decodificado y redimensionado por (url, px) en ~/.cache/pasos
+    key = hashlib.blake2b(icon_str.encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(ICON_CACHE_DIR, f"{key}_{px}.npy")
+
+def load_icon_cache(path: str):
+    try:
+        arr = np.load(path)
+        os.utime(path)  # mtime = último uso, para el LRU
+        return arr
+    except (OSError, ValueError):
+        return None
+
+def etag_path(path: str) -> str:
+    # Al lado del .npy: el ETag del servidor; su mtime = última validación
+    return os.path.splitext(path)[0] + ".etag"
+
+def read_etag(path: str):
+    # (etag, fresco): fresco si se validó hace menos de ICON_MAX_AGE
+    try:
+        p = etag_path(path)
+        with open(p, encoding="utf-8") as f:
+            etag = f.read() or None
+        return etag, time.time() - os.path.getmtime(p) < ICON_MAX_AGE
+    except OSError:
+        return None, False
+
+def save_etag(path: str, etag):
+    try:
+        with open(etag_path(path), "w", encoding="utf-8") as f:
+            f.write(etag or "")
+    except OSError:
+        pass
+
+def save_icon_cache(arr: np.ndarray, path: str, etag=None):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, arr)
+        os.replace(tmp, path)
+        save_etag(path, etag)
+        prune_icon_cache()
+    except OSError:
+        pass  # sin disco escribible nos queda la caché en memoria
+
+def prune_icon_cache():
+    # LRU por icono: el .npy y su .etag van juntos, con el mtime más reciente
+    # de los dos (el .npy se toca en cada acierto, el .etag al revalidar).
+    # Los .tmp son escrituras en curso de otro hilo: no se tocan
+    entries = {}   # ruta sin extensión -> [mtime, tamaño, rutas]
+    with os.scandir(ICON_CACHE_DIR) as it:
+        for e in it:
+            stem, ext = os.path.splitext(e.path)
+            if ext not in (".npy", ".etag") or not e.is_file():
+                continue
+            info = e.stat()
+            entry = entries.setdefault(stem, [0.0, 0, []])
+            entry[0] = max(entry[0], info.st_mtime)
+            entry[1] += info.st_size
+            entry[2].append(e.path)
+    total = sum(size for _, size, _ in entries.values())
+    for _, size, paths in sorted(entries.values()):
+        if total <= ICON_CACHE_BYTES:
+            break
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+
+def resize_icon(img, px: int):
+    from PIL import Image
+    # JPEG: libjpeg decodifica ya reducido (~2× el destino) con escalado DCT.
+    # A 48×48 BILINEAR no se distingue de LANCZOS y es bastante más barato
+    img.draft("RGB", (2 * px, 2 * px))
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA")  # paletas, grises...: reduce() no los admite todos
+    # Fuente de más de 2× el destino (PNG grandes): antes, reduce() por un factor
+    # entero (media por bloques, una pasada barata) hasta ~2× px. Pillow ignora
+    # reducing_gap en RGBA, por eso se hace a mano
+    factor = min(img.size) // (2 * px)
+    if factor > 1:
+        img = img.reduce(factor)
+    return img.convert("RGBA").resize((px, px), Image.Resampling.BILINEAR)
+
+# En memoria una hora como mucho; al caducar se relee del disco, que pasado
+# ICON_MAX_AGE revalida con el servidor. Un icono nuevo llega al gráfico
+# porque el atlas y los PNG van por la huella del contenido (icon_digest)
+@st.cache_resource(show_spinner=False, ttl=3600, max_entries=256)
+def fetch_image(icon_str: str, px: int = 48, raw_github: bool = True):
+    # Devuelve el icono como array RGBA (px, px, 4), listo para el atlas
+    from PIL import Image
+    try:
+        if not isinstance(icon_str, str) or not icon_str.strip():
+            return None
+        icon_str = icon_str.strip()
+        if raw_github:
+            icon_str = to_raw_if_github(icon_str)
+
+        if is_url(icon_str):
+            # Caché en disco: sobrevive reruns, sesiones y reinicios del proceso
+            cache_path = icon_cache_path(icon_str, px)
+            arr = load_icon_cache(cache_path)
+            etag, fresh = read_etag(cache_path) if arr is not None else (None, False)
+            if fresh:
+                return arr
+
+            # Copia vieja: GET condicional; un 304 no trae cuerpo ni hay que decodificar
+            headers = {"If-None-Match": etag} if etag else {}
+            try:
+                r = http_session().get(icon_str, timeout=10, allow_redirects=True, headers=headers)
+            except requests.RequestException:
+                if arr is not None:
+                    return arr  # sin red vale la copia del disco
+                raise
+            if r.status_code == 304 and arr is not None:
+                save_etag(cache_path, etag)
+                return arr
+
+            r.raise_for_status()
+            arr = np.asarray(resize_icon(Image.open(io.BytesIO(r.content)), px))
+            save_icon_cache(arr, cache_path, r.headers.get("ETag"))
+            return arr
+        else:
+            if not os.path.exists(icon_str):
+                return None
+            return np.asarray(resize_icon(Image.open(icon_str), px))
+
+    except Exception as e:
+        st.warning(f"No pude cargar imagen: {icon_str}\nDetalles: {e}")
+        return None
+
+def fetch_images(icons, px: int = 48, raw_github: bool = True) -> dict:
+    # Descarga en paralelo (I/O): cada URL única una sola vez, también si la
+    # misma imagen aparece como enlace blob de GitHub y como raw
+    targets = {icon: to_raw_if_github(icon) if raw_github else icon for icon in icons}
+    unique = list(dict.fromkeys(targets.values()))
+    if not unique:
+        return {}
+    # Los hilos heredan el contexto del script para que st.warning siga funcionando
+    with ThreadPoolExecutor(
+        max_workers=FETCH_WORKERS, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())
+    ) as ex:
+        imgs = dict(zip(unique, ex.map(lambda s: fetch_image(s, px=px, raw_github=raw_github), unique)))
+    return {icon: imgs[t] for icon, t in targets.items()}
+
+def icon_digest(arr: np.ndarray) -> str:
+    return hashlib.blake2b(arr.tobytes(), digest_size=8).hexdigest()
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def icon_atlas(loaded: tuple, _imgs: dict, px: int = 48):
+    # Iconos cargados en un único buffer RGBA contiguo (N, px, px, 4).
+    # La clave de caché es la tupla (icono, huella) (Streamlit no hashea _imgs);
+    # slots: icono -> fila del atlas
+    atlas = np.zeros((len(loaded), px, px, 4), dtype=np.uint8)
+    for k, (icon, _) in enumerate(loaded):
+        atlas[k] = _imgs[icon]
+    # Compartido entre sesiones y artistas: solo lectura
+    atlas.flags.writeable = False
+    return atlas, {icon: k for k, (icon, _) in enumerate(loaded)}
+
+def draw_png(ax, x, y, img):
+    from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+    # img es una fila del atlas (vista, sin convertir desde PIL por artista)
+    oi = OffsetImage(img, zoom=1.0)
+    ab = AnnotationBbox(oi, (x, y), frameon=False, box_alignment=(0.5, 0.5))
+    ax.add_artist(ab)
+    return ab
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def to_arrow(df: pd.DataFrame) -> pa.Table:
+    # Conversión a Arrow una vez por versión de datos (la tabla es inmutable)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def thousands(x, pos):
+    return f"{int(x):,}"
+
+# --------------------- Plotting ---------------------
+
+def render_chart(
+    df: pd.DataFrame, value_col: str, title: str, axis_factor: float = 1.5,
+    style: ChartStyle = ChartStyle(), raw_github: bool = True,
+):
+    # axis_factor: el eje x llega hasta axis_factor × el líder
+    # raw_github: reescribir enlaces blob de GitHub a raw antes de descargar
+    # Columnas a NumPy una sola vez; lo demás trabaja sobre los arrays
+    pasos = df[value_col].to_numpy(dtype=np.int64)
+    if not pasos.size:
+        st.info("No hay datos para mostrar.")
+        return
+    nombres = df["Nombre"].to_numpy()
+    if "Icon" in df.columns:
+        icon_s = df["Icon"].fillna("").astype(str).str.strip()
+    else:
+        icon_s = pd.Series("", index=df.index)
+    icons = icon_s.to_numpy()
+    is_img = image_mask(icon_s)
+
+    # Imágenes descargadas antes, en paralelo (fuera de la caché del PNG para
+    # que los avisos de carga se vean en cada rerun)
+    imgs = fetch_images(sorted(set(icons[is_img])), raw_github=raw_github)
+    # (icono, huella de sus píxeles): si un icono cambia arriba y se revalida,
+    # la clave del atlas y de los PNG cambia con él
+    loaded = tuple((i, icon_digest(img)) for i, img in imgs.items() if img is not None)
+    atlas, slots = icon_atlas(loaded, imgs)
+
+    # El PNG se cachea por contenido: sin cambios en los datos no se toca matplotlib
+    payload = tuple(zip(nombres.tolist(), pasos.tolist(), icons.tolist(), is_img.tolist()))
+    st.image(chart_png(payload, loaded, title, axis_factor, style, atlas, slots), width="stretch")
+
+def chart_png(payload: tuple, loaded: tuple, title: str, axis_factor: float, style: ChartStyle, atlas, slots) -> bytes:
+    # Atajo por sesión: mientras la huella no cambie se reutilizan los bytes de
+    # session_state sin hashear el payload en st.cache_data ni copiar su resultado
+    fp = hash((payload, loaded, title, axis_factor, style))
+    cached = st.session_state.get("chart_png")
+    if cached is not None and cached[0] == fp:
+        return cached[1]
+
+    # Si solo cambiaron los valores (mismos nombres, iconos y título) se mueven
+    # los artistas de la figura viva de la sesión en vez de redibujarla entera
+    nombres, pasos, icons, is_img = zip(*payload)
+    layout = hash((nombres, icons, is_img, loaded, title, axis_factor, style))
+    live = st.session_state.get("fig")
+    if live is not None and live["layout"] == layout and move_chart(live, pasos):
+        png = figure_png(live["fig"])
+    elif cached is None:
+        # Primer pintado de la sesión: el PNG compartido entre sesiones
+        png = render_png(payload, loaded, title, axis_factor, style, atlas, slots)
+    else:
+        # Una sola Figure por sesión (suelta, no pyplot, para que muera con
+        # ella): si cambió la estructura se limpian los ejes con cla()
+        from matplotlib.figure import Figure
+        if live is None:
+            fig = Figure(figsize=(11, 3))
+            ax = fig.subplots()
+        else:
+            fig, ax = live["fig"], live["ax"]
+            ax.cla()
+        live = draw_chart(ax, payload, title, axis_factor, style, atlas, slots)
+        live.update(fig=fig, layout=layout, axis_factor=axis_factor, style=style)
+        st.session_state["fig"] = live
+        png = figure_png(fig)
+
+    st.session_state["chart_png"] = (fp, png)
+    return png
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_png(payload: tuple, loaded: tuple, title: str, axis_factor: float, style: ChartStyle, _atlas, _slots) -> bytes:
+    # loaded (iconos con imagen + huella de sus píxeles) entra en la clave
+    # porque cambia lo que se dibuja.
+    # Figure suelta: sin pyplot no hay backend ni registro de figuras que cerrar
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(11, 3))
+    draw_chart(fig.subplots(), payload, title, axis_factor, style, _atlas, _slots)
+    return figure_png(fig)
+
+def figure_png(fig) -> bytes:
+    # Mismas opciones que usaba st.pyplot
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+def chart_layout(pasos, axis_factor: float, style: ChartStyle):
+    # Eje máximo = axis_factor × el líder (exacto)
+    pasos = np.asarray(pasos)
+    MAX_STEPS = max(int(np.ceil(pasos.max() * axis_factor)), 10)
+
+    # 1) Entradas con y-base (apila si comparten x): orden estable por x y
+    #    nivel = posición dentro del grupo de misma x (ya ordenado, cada grupo
+    #    es un tramo contiguo: nivel = índice - inicio del tramo)
+    STACK_STEP = 0.35
+    order = np.argsort(pasos, kind="stable")
+    xs = pasos[order]
+    idx = np.arange(len(xs))
+    new_group = np.concatenate(([True], np.diff(xs) != 0))
+    level = idx - np.maximum.accumulate(np.where(new_group, idx, 0))
+    base_ys = 0.55 + level * STACK_STEP
+    if style.center_stacks:
+        # Pila centrada en y=0.55: baja medio paso por cada entrada extra del grupo
+        starts = np.flatnonzero(new_group)
+        size = np.diff(np.append(starts, len(xs)))[np.cumsum(new_group) - 1]
+        base_ys -= (size - 1) * (STACK_STEP / 2.0)
+
+    # 2) Escalonar etiquetas (nombres) cuando están cerca en x: un cluster
+    #    empieza donde el salto supera el umbral y dentro de él los niveles rotan
+    NEAR_PCT = 0.03                    # cercanía = 3% del eje
+    dx_thresh = MAX_STEPS * NEAR_PCT
+    LABEL_LEVELS = np.array([0.35, 0.60, 0.85])  # offsets verticales
+
+    if style.stagger_labels:
+        new_cluster = np.concatenate(([True], np.diff(xs) > dx_thresh))
+        cluster_start = np.maximum.accumulate(np.where(new_cluster, idx, 0))
+        label_level = (idx - cluster_start) % len(LABEL_LEVELS)
+        name_ys = base_ys + LABEL_LEVELS[label_level]
+    else:
+        name_ys = base_ys + LABEL_LEVELS[0]
+
+    # Todo en orden de x; order[i] es la fila original de la posición i
+    return MAX_STEPS, order, xs, base_ys, name_ys
+
+def set_xaxis(ax, MAX_STEPS: int, style: ChartStyle):
+    from matplotlib.ticker import MaxNLocator, FuncFormatter
+    ax.set_xlim(0, MAX_STEPS)
+    if style.step_ticks:
+        # Un tick cada décimo del eje, en enteros
+        ticks = list(range(0, MAX_STEPS + 1, max(1, MAX_STEPS // 10)))
+        ax.set_xticks(ticks)
+        ax.set_xticklabels([f"{t:,}" for t in ticks], fontsize=9)
+    else:
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=10, integer=True, steps=[1, 2, 5, 10]))
+        ax.xaxis.set_major_formatter(FuncFormatter(thousands))
+
+def draw_chart(ax, payload: tuple, title: str, axis_factor: float, style: ChartStyle, atlas, slots) -> dict:
+    # Dibuja en ax y devuelve los artistas por fila original para poder moverlos
+    from matplotlib.font_manager import FontProperties
+    nombres, pasos, icons, is_img = zip(*payload)
+    MAX_STEPS, order, xs, base_ys, name_ys = chart_layout(pasos, axis_factor, style)
+    ax.axhline(0, linewidth=1)
+
+    # 3) Dibujar iconos / marcadores + nombres
+    n = len(pasos)
+    icon_arts = [None] * n
+    no_icon = np.zeros(n, dtype=bool)   # filas sin icono: un solo scatter al final
+    icon_kw = dict(ha="center", va="center", fontproperties=FontProperties(size=22))
+    text = ax.text
+    for r, steps, base_y in zip(order.tolist(), xs.tolist(), base_ys.tolist()):
+        icon = icons[r]
+        if is_img[r]:
+            k = slots.get(icon)
+            if k is not None:
+                icon_arts[r] = draw_png(ax, steps, base_y, atlas[k])
+        elif icon:
+            icon_arts[r] = text(steps, base_y, icon, **icon_kw)
+
+        no_icon[r] = icon_arts[r] is None
+
+    # Nombres en una pasada aparte, sin ramas (y siempre por encima de los iconos)
+    name_arts = [None] * n
+    name_kw = dict(ha="center", va="bottom", fontproperties=FontProperties(weight="bold", size=9))
+    for r, steps, name_y in zip(order.tolist(), xs.tolist(), name_ys.tolist()):
+        name_arts[r] = text(steps, name_y, nombres[r], **name_kw)
+
+    # Líneas verticales y marcadores: una colección cada uno en vez de N Line2D
+    stems = ax.vlines(xs, 0.02, base_ys - 0.02, linewidth=0.8, alpha=0.6)
+    markers = None
+    m = no_icon[order]   # máscara en orden de x, alineada con xs / base_ys
+    if m.any():
+        markers = ax.scatter(xs[m], base_ys[m], s=64, zorder=3)   # encima de las líneas
+
+    # 4) Ticks & estilo
+    set_xaxis(ax, MAX_STEPS, style)
+    ax.set_ylim(*style.ylim)
+    ax.set_yticks([])
+    ax.grid(axis="x", alpha=0.25)
+    ax.set_title(title, fontsize=style.title_size, pad=10)
+
+    return dict(ax=ax, order=order, icons=icon_arts, names=name_arts, stems=stems, markers=markers, no_icon=no_icon)
+
+def move_chart(live: dict, pasos: tuple) -> bool:
+    # Recalcula el layout y solo actualiza posiciones (xybox / set_position).
+    # Los artistas conservan el orden en que se dibujaron: si las filas cambian
+    # de orden, lo que se solapa se apilaría distinto que en un dibujo nuevo,
+    # así que entonces no se mueve nada y se devuelve False para redibujar
+    from matplotlib.offsetbox import AnnotationBbox
+    MAX_STEPS, order, xs, base_ys, name_ys = chart_layout(pasos, live["axis_factor"], live["style"])
+    if not np.array_equal(order, live["order"]):
+        return False
+    rows = zip(order.tolist(), xs.tolist(), base_ys.tolist(), name_ys.tolist())
+    for r, steps, base_y, name_y in rows:
+        art = live["icons"][r]
+        if isinstance(art, AnnotationBbox):
+            art.xy = art.xybox = (steps, base_y)
+        elif art is not None:
+            art.set_position((steps, base_y))
+        live["names"][r].set_position((steps, name_y))
+
+    bottoms = np.column_stack((xs, np.full(len(xs), 0.02)))
+    tops = np.column_stack((xs, base_ys - 0.02))
+    live["stems"].set_segments(np.stack((bottoms, tops), axis=1))
+    if live["markers"] is not None:
+        m = live["no_icon"][order]
+        live["markers"].set_offsets(np.column_stack((xs[m], base_ys[m])))
+    set_xaxis(live["ax"], MAX_STEPS, live["style"])
+    return True